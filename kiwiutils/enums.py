@@ -1,13 +1,30 @@
 import abc
+import functools
 from enum import Enum
-from collections import defaultdict
 from typing import Iterable, Type, Any
 
 import aenum
 import pandas as pd
-import numpy as np
 
-from kiwiutils.kiwilib import IsDataclass, getAllSubclasses
+from kiwiutils.kiwilib import IsDataclass, getAllSubclasses, _invalidate_subclass_cache
+
+
+@functools.lru_cache(maxsize=None)
+def _dataclass_field_names(dataclass_: IsDataclass) -> frozenset:
+    """
+    Field-name set of a dataclass, shared across every `DataclassValuedEnum` subclass
+    whose `_get_dataclass` returns the same dataclass.
+    """
+    return frozenset(dataclass_.__dataclass_fields__)
+
+
+@functools.lru_cache(maxsize=None)
+def _all_subclasses_cached(class_: type) -> tuple[type, ...]:
+    """
+    Memoized form of `getAllSubclasses` for the hot `HierarchicalEnum` iteration paths.
+    Invalidated in `HierarchicalEnum.__init_subclass__` whenever the subclass graph grows.
+    """
+    return tuple(getAllSubclasses(class_))
 
 class AenumABCMeta(abc.ABCMeta, aenum.EnumMeta):
     pass
@@ -57,14 +74,20 @@ class DataclassValuedEnum(abc.ABC, aenum.Enum, metaclass=AenumABCMeta):
         cls.dataclass = cls._get_dataclass()
         cls._data = cls._enum_data()
         if cls._data is not None:
-            for fld in cls.dataclass.__dataclass_fields__:
-                setattr(cls, fld, property(lambda slf, f=fld: getattr(slf._data[slf], f)))
+            # Attribute access is routed through `__getattr__` rather than one `property` per field.
+            cls._field_names = _dataclass_field_names(cls.dataclass)
         return cls
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         cls = cls._init_DVE(cls)
 
+    def __getattr__(self, name: str):
+        # Only called when regular attribute lookup fails, i.e., for dataclass field access.
+        if name in getattr(type(self), '_field_names', ()):
+            return getattr(self._data[self], name)
+        raise AttributeError(name)
+
     def __repr__(self):
         return ''.join(['<', str(self), ': ', repr(self.value), '; ', repr(self._data[self]), '>'])
 
@@ -91,24 +114,33 @@ class HierarchicalEnum(abc.ABC):
         return HierarchicalEnum
 
     def __repr__(self):
-        if type(self) == self.root_class():
-            return type(self).__name__
-        else:
-            # return type(self).__bases__[0]().__repr__() + '.' + type(self).__name__
-            return self.root_class().__name__ + '.' + type(self).__name__
-            # return type(self).__name__
+        # `root_class()` walks the MRO, so the repr string is computed once per class and cached.
+        cls = type(self)
+        out = cls.__dict__.get('_repr_cache')
+        if out is None:
+            root = self.root_class()
+            out = cls.__name__ if cls is root else root.__name__ + '.' + cls.__name__
+            cls._repr_cache = out
+        return out
 
     def __eq__(self, other):
         return type(self) == type(other)
 
     def __hash__(self):
-        return hash(repr(type(self)))
+        # Equality is type identity, so hashing the type directly is equivalent to the
+        # old hash(repr(type(self))) without building a string per lookup.
+        return hash(type(self))
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _all_subclasses_cached.cache_clear()
+        _invalidate_subclass_cache()
 
     def __iter__(self):
-        return iter([c() for c in getAllSubclasses(type(self))])
+        return (c() for c in _all_subclasses_cached(type(self)))
 
     def __len__(self):
-        return len(getAllSubclasses(type(self)))
+        return len(_all_subclasses_cached(type(self)))
 
 
 
@@ -120,22 +152,29 @@ def enum_counts(ser: pd.Series, enumCls: type[Enum] | Iterable[type[Hierarchical
     :return: A integer-valued DataFrame with columns as all the members of `enumCls`.
     Data is the count of instances of that enum member in that row in `ser`.
     """
-    def make_count(lst: Iterable, enumCls1: Iterable[type]) -> list[int]:
-        if len(lst) == 0:
-            lst.extend([0] * len(enumCls1))
-            return lst
-        countDict = defaultdict(lambda: 0)
-        for item in lst:
-            countDict[item] += 1
-        lst.clear()
-        lst.extend([countDict[e] for e in enumCls1])
-
     enumList = list(enumCls)
-    ser.apply(make_count, args=(enumList,))
-    out = pd.DataFrame(np.vstack(ser.values), index=ser.index)
-    # TODO: bugfix: rename goes crazy on SocialGroups
     if isinstance(enumList[0], HierarchicalEnum):
         target_names = [str(a) for a in enumList]
     else:
-        target_names = [str(e) for e in list(enumList)]
-    return out.rename(columns=dict(zip(range(len(enumList)), target_names)))
+        target_names = [str(e) for e in enumList]
+    # Explode the rows of iterables into a flat Series and count at the C level rather than per-row in Python.
+    # Members are mapped to integer codes first since enum members aren't orderable.
+    codes = {e: i for i, e in enumerate(enumList)}
+    exploded = ser.explode().dropna().map(codes).dropna()
+    if len(exploded) == 0:
+        out = pd.DataFrame(0, index=ser.index, columns=range(len(enumList)))
+    elif len(enumList) > 64:
+        # Wide enums produce mostly-zero rows; sparse dummies keep memory proportional
+        # to the number of instances rather than rows x members.
+        dummies = pd.get_dummies(exploded.astype(int), sparse=True)
+        out = dummies.groupby(level=0).sum().reindex(
+            index=ser.index, columns=range(len(enumList)), fill_value=0
+        )
+    else:
+        out = pd.crosstab(exploded.index, exploded.astype(int)).reindex(
+            index=ser.index, columns=range(len(enumList)), fill_value=0
+        )
+    out.columns = target_names
+    out.columns.name = None
+    out.index.name = ser.index.name
+    return out
@@ -5,7 +5,6 @@ This module contains utilities related to finite-valued types.
 from typing import (
     TypeVar,
     Callable,
-    Generator,
     Iterable,
     Union,
     get_origin,
@@ -14,13 +13,12 @@ from typing import (
 )
 from types import UnionType
 from functools import cache, wraps
-from dataclasses import Field
 import itertools
 
 import enum
 import frozendict
 
-from kiwiutils.kiwilib import IsDataclass, flatten, is_abstract
+from kiwiutils.kiwilib import IsDataclass, is_abstract
 
 """
 # `FiniteValued`
@@ -71,14 +69,17 @@ Their range is the union of the ranges of their subtypes.
 """
 FiniteValued = TypeVar("FiniteValued", bound=bool | IsDataclass | enum.Enum)
 
+# Range of the `bool` base case, built once since it's the innermost leaf of most recursions.
+_BOOL_VALUES: tuple[bool, bool] = (True, False)
+
 
 def _apply_validation_func(
     type_: FiniteValued,
-    vals: Generator[FiniteValued, None, None],
+    vals: Iterable[FiniteValued],
     validation_funcs: (
         frozendict.frozendict[FiniteValued, Callable[[FiniteValued], bool]] | None
     ) = None,
-) -> Generator[FiniteValued, None, None]:
+) -> Iterable[FiniteValued]:
     """
     Helper function for `all_instances`.
     Filters `vals` according to `validation_funcs`.
@@ -87,7 +88,7 @@ def _apply_validation_func(
 
     # Parameters
     - `type_: FiniteValued`: A type
-    - `vals: Generator[FiniteValued, None, None]`: Instances of `type_`
+    - `vals: Iterable[FiniteValued]`: Instances of `type_`
     - `validation_funcs: dict`: Collection of types mapped to filtering validation functions
     """
     if validation_funcs is None:
@@ -97,25 +98,64 @@ def _apply_validation_func(
     elif hasattr(
         type_, "__mro__"
     ):  # Generic types like UnionType, Literal don't have `__mro__`
-        for superclass in type_.__mro__:
-            if superclass not in validation_funcs:
-                continue
+        hits = validation_funcs.keys() & set(type_.__mro__)
+        if hits:
+            # Only the first validation function hit in the mro is applied
+            superclass = next(c for c in type_.__mro__ if c in hits)
             vals = filter(validation_funcs[superclass], vals)
-            break  # Only the first validation function hit in the mro is applied
-    elif get_origin(type_) == Literal:
-        return flatten(
-            (
-                _apply_validation_func(type(v), [v], validation_funcs)
-                for v in get_args(type_)
-            ),
-            levels_to_flatten=1,
+    elif _classify_type(type_)[0] == "literal":
+        return itertools.chain.from_iterable(
+            _apply_validation_func(type(v), [v], validation_funcs)
+            for v in _classify_type(type_)[1]
         )
     return vals
 
 
+@cache
+def _classify_type(type_: FiniteValued) -> tuple[str, tuple]:
+    """
+    Classifies a generic type into the kind tags handled by `all_instances`, bundling its args.
+    Cached since the same parametrized types recur throughout a recursive enumeration tree
+    and `get_origin`/`get_args` redo non-trivial work on every call.
+    """
+    origin = get_origin(type_)
+    if origin is tuple:
+        return "tuple", get_args(type_)
+    if origin in (UnionType, Union):
+        return "union", get_args(type_)
+    if origin is Literal:
+        return "literal", get_args(type_)
+    return "unsupported", ()
+
+
+@cache
+def _dataclass_field_info(type_: IsDataclass) -> tuple[tuple[str, ...], tuple[type, ...]]:
+    """
+    Returns the field names and field types of a dataclass as parallel tuples.
+    Cached so the recursive hot path in `all_instances` doesn't rebuild dicts per call.
+    """
+    flds = type_.__dataclass_fields__
+    return tuple(flds), tuple(f.type for f in flds.values())
+
+
+@cache
+def _dataclass_ctor(type_: IsDataclass) -> Callable[..., IsDataclass]:
+    """
+    Returns the cheapest constructor for `type_` taking field values positionally in field order.
+    Dataclass `__init__` binds fields positionally, so the class itself is usually the answer;
+    only keyword-only fields force the kwargs path.
+    """
+    if any(getattr(f, "kw_only", False) for f in type_.__dataclass_fields__.values()):
+        names, _ = _dataclass_field_info(type_)
+        return lambda *args: type_(**dict(zip(names, args)))
+    return type_
+
+
 def _all_instances_wrapper(f):
     """
     Converts dicts to frozendicts to allow caching and applies `_apply_validation_func`.
+    Cached results are materialized into tuples so that cache hits yield fresh iterators
+    rather than re-serving an exhausted generator.
     """
 
     @wraps(f)
@@ -128,10 +168,11 @@ def _all_instances_wrapper(f):
                 frozendict.frozendict[FiniteValued, Callable[[FiniteValued], bool]]
                 | None
             ),
-        ):
-            return _apply_validation_func(
-                type_, all_instances_func(type_, validation_funcs), validation_funcs
-            )
+        ) -> tuple:
+            vals = all_instances_func(type_, validation_funcs)
+            if validation_funcs is None:
+                return tuple(vals)
+            return tuple(_apply_validation_func(type_, vals, validation_funcs))
 
         if len(args) >= 2 and args[1] is not None:
             validation_funcs: frozendict.frozendict = frozendict.frozendict(args[1])
@@ -141,7 +182,7 @@ def _all_instances_wrapper(f):
             )
         else:
             validation_funcs = None
-        return cached_wrapper(args[0], f, validation_funcs)
+        return iter(cached_wrapper(args[0], f, validation_funcs))
 
     return wrapper
 
@@ -150,7 +191,7 @@ def _all_instances_wrapper(f):
 def all_instances(
     type_: FiniteValued,
     validation_funcs: dict[FiniteValued, Callable[[FiniteValued], bool]] | None = None,
-) -> Generator[FiniteValued, None, None]:
+) -> Iterable[FiniteValued]:
     """
     Returns all possible values of an instance of `type_` if finite instances exist.
     Uses type hinting to construct the possible values.
@@ -187,56 +228,43 @@ def all_instances(
     - If a superclass of `type_` is found while searching in mro order, that validation function is applied and the list is returned.
     - If no superclass of `type_` is found, then no filter is applied.
     """
-    if type_ == bool:
-        yield from [True, False]
-    elif hasattr(type_, "__dataclass_fields__"):
+    if type_ is bool:
+        return _BOOL_VALUES
+    if hasattr(type_, "__dataclass_fields__"):
         if is_abstract(type_):
             # Abstract dataclass: call `all_instances` on each subclass
-            yield from flatten(
-                (
-                    all_instances(sub, validation_funcs)
-                    for sub in type_.__subclasses__()
-                ),
-                levels_to_flatten=1,
-            )
-        else:
-            # Concrete dataclass: construct dataclass instances with all possible combinations of fields
-            fields: list[Field] = type_.__dataclass_fields__
-            fields_to_types: dict[str, type] = {f: fields[f].type for f in fields}
-            all_arg_sequences: Iterable = itertools.product(
-                *[
-                    all_instances(arg_type, validation_funcs)
-                    for arg_type in fields_to_types.values()
-                ]
-            )
-            yield from (
-                type_(**{fld: arg for fld, arg in zip(fields_to_types.keys(), args)})
-                for args in all_arg_sequences
+            return itertools.chain.from_iterable(
+                all_instances(sub, validation_funcs)
+                for sub in type_.__subclasses__()
             )
-    else:
-        type_origin = get_origin(type_)
-        if type_origin == tuple:
-            # Only matches Generic type tuple since regular tuple is not finite-valued
-            # Generic tuple: Similar to concrete dataclass. Construct all possible combinations of tuple fields.
-            yield from (
-                tuple(combo)
-                for combo in itertools.product(
-                    *(
-                        all_instances(tup_item, validation_funcs)
-                        for tup_item in get_args(type_)
-                    )
-                )
-            )
-        elif type_origin in (UnionType, Union):
-            # Union: call `all_instances` for each type in the Union
-            yield from flatten(
-                [all_instances(sub, validation_funcs) for sub in get_args(type_)],
-                levels_to_flatten=1,
-            )
-        elif type_origin is Literal:
-            # Literal: return all Literal arguments
-            yield from get_args(type_)
-        else:
-            raise TypeError(
-                f"Type {type_} either has unbounded possible values or is not supported (Enum is not supported)."
+        # Concrete dataclass: construct dataclass instances with all possible combinations of fields
+        _, field_types = _dataclass_field_info(type_)
+        ctor = _dataclass_ctor(type_)
+        # Materialize each field's range once; `itertools.product` then runs its
+        # C-level odometer over the tuples without re-consuming any generators.
+        field_ranges = [
+            tuple(all_instances(arg_type, validation_funcs))
+            for arg_type in field_types
+        ]
+        return (ctor(*args) for args in itertools.product(*field_ranges))
+    type_kind, type_args = _classify_type(type_)
+    if type_kind == "tuple":
+        # Only matches Generic type tuple since regular tuple is not finite-valued
+        # Generic tuple: Similar to concrete dataclass. Construct all possible combinations of tuple fields.
+        return itertools.product(
+            *(
+                tuple(all_instances(tup_item, validation_funcs))
+                for tup_item in type_args
             )
+        )
+    if type_kind == "union":
+        # Union: call `all_instances` for each type in the Union
+        return itertools.chain.from_iterable(
+            all_instances(sub, validation_funcs) for sub in type_args
+        )
+    if type_kind == "literal":
+        # Literal: return all Literal arguments
+        return type_args
+    raise TypeError(
+        f"Type {type_} either has unbounded possible values or is not supported (Enum is not supported)."
+    )
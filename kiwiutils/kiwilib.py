@@ -5,7 +5,9 @@ Container for misc code usable across projects.
 import abc
 import functools
 import datetime
-import math
+import heapq
+import itertools
+import operator
 from enum import EnumMeta, Enum
 from dataclasses import fields as dataclass_fields, dataclass
 from collections import defaultdict
@@ -50,10 +52,21 @@ def isin(collxn, val) -> bool:
 def dt64_2_dt(dt64):
     """
     Converts a datetime64 to a datetime type
-    :param dt64: datetime64, behavior when passed a regular datetime untested
+    :param dt64: datetime64 scalar or array thereof, behavior when passed a regular datetime untested
     :return: datetime type of the arg
     """
-    return datetime.datetime.utcfromtimestamp(dt64.astype(datetime.datetime) * 1e-9)
+    # pandas' C converter handles any datetime64 unit and avoids the lossy
+    # float-seconds round trip through utcfromtimestamp.
+    if isinstance(dt64, np.ndarray):
+        return pd.DatetimeIndex(dt64).to_pydatetime()
+    return pd.Timestamp(dt64).to_pydatetime()
+
+
+# Common list-like types mapped to their constructors for the `mapOverListLike` fast path.
+_LISTLIKE_CTORS: dict = {list: list, tuple: tuple, set: set, frozenset: frozenset}
+
+# Atomic types rejected by `mapOverListLike` without paying for pandas' `is_list_like` introspection.
+_DEFINITELY_NOT_LISTLIKE: tuple = (str, bytes, bytearray, int, float, bool, complex, type(None))
 
 
 def mapOverListLike(func, listLike: Iterable) -> Iterable:
@@ -70,17 +83,69 @@ def mapOverListLike(func, listLike: Iterable) -> Iterable:
     :param listLike: A list-like container to be iterated over.
     :return: An iterable of same type as listLike with func applied to its elements.
     """
-    if not is_list_like(listLike):
+    ctor = _LISTLIKE_CTORS.get(type(listLike))
+    if ctor is not None:
+        # Feed `map` directly into the constructor: no intermediate list, no isinstance checks.
+        return ctor(map(func, listLike))
+    if isinstance(listLike, _DEFINITELY_NOT_LISTLIKE) or not is_list_like(listLike):
         raise TypeError(f'{type(listLike)} is not list-like. Add a type check in the caller.')
-    elif isinstance(listLike, pd.Series):
+    return mapOverListLike_unchecked(func, listLike)
+
+
+def mapOverListLike_unchecked(func, listLike: Iterable) -> Iterable:
+    """
+    `mapOverListLike` without the list-like type check.
+    For callers which have already validated `listLike`, e.g., via an outer `is_list_like` call.
+    """
+    ctor = _LISTLIKE_CTORS.get(type(listLike))
+    if ctor is not None:
+        return ctor(map(func, listLike))
+    if isinstance(listLike, pd.Series):
         return listLike.apply(func)
-    # elif not isinstance(type(listLike), collections.Callable):
-    #     raise TypeError(f'Cannot generically cast to type {type(listLike)}')
-    # elif isinstance(listLike, collections.Callable):
     return type(listLike)([func(i) for i in listLike])
 
 
 
+# Cheap isinstance checks replacing per-element `hasattr(x, '__iter__')` in `flatten`:
+# common containers descend, known-atomic types are leaves, and only exotic types
+# fall back to the `__iter__` probe.
+_COMMON_ITER: tuple = (list, tuple, set, frozenset, dict)
+_ATOMIC: tuple = (str, bytes, bytearray, memoryview)
+
+
+def _should_descend(x) -> bool:
+    """Returns whether `flatten` should recurse into `x` rather than yield it as a leaf."""
+    if isinstance(x, _COMMON_ITER):
+        return True
+    return not isinstance(x, _ATOMIC) and hasattr(x, "__iter__")
+
+
+def _flatten_full(it: Iterable[Any]) -> Generator:
+    """
+    Fully flattens `it` with an explicit stack of iterators instead of one generator frame per nesting level.
+    """
+    stack: list = [iter(it)]
+    while stack:
+        for x in stack[-1]:
+            if _should_descend(x):
+                stack.append(iter(x))
+                break
+            yield x
+        else:
+            stack.pop()
+
+
+def _flatten_bounded(it: Iterable[Any], levels_to_flatten: int) -> Generator:
+    """
+    Flattens `it` by exactly `levels_to_flatten` levels, recursing since the depth is bounded.
+    """
+    for x in it:
+        if levels_to_flatten > 0 and _should_descend(x):
+            yield from _flatten_bounded(x, levels_to_flatten - 1)
+        else:
+            yield x
+
+
 def flatten(it: Iterable[Any], levels_to_flatten: Optional[int] = None) -> Generator:
     """
     Flattens an arbitrarily nested iterable.
@@ -93,17 +158,9 @@ def flatten(it: Iterable[Any], levels_to_flatten: Optional[int] = None) -> Gener
     - `it`: Any arbitrarily nested iterable.
     - `levels_to_flatten`: Number of levels to flatten by, starting at the outermost layer. If `None`, performs full flattening.
     """
-    for x in it:
-        if (
-            hasattr(x, "__iter__")
-            and not isinstance(x, (str, bytes))
-            and (levels_to_flatten is None or levels_to_flatten > 0)
-        ):
-            yield from flatten(
-                x, None if levels_to_flatten is None else levels_to_flatten - 1
-            )
-        else:
-            yield x
+    if levels_to_flatten is None:
+        return _flatten_full(it)
+    return _flatten_bounded(it, levels_to_flatten)
 
 
 def is_abstract(cls: type) -> bool:
@@ -118,28 +175,46 @@ def is_abstract(cls: type) -> bool:
         return True  # an abstract class
 
 
+@lru_cache(maxsize=256)
+def _getAllSubclasses_cached(class_: type, includeSelf: bool = False) -> frozenset[type]:
+    """
+    Memoized recursion for `getAllSubclasses`.
+    Set unions are used rather than `flatten` since flattening would recurse into
+    class objects whose instances happen to define `__iter__`.
+    """
+    subs: set[type] = set().union(
+        *(
+            _getAllSubclasses_cached(sub, includeSelf=True)
+            for sub in class_.__subclasses__()
+            if sub is not None
+        )
+    )
+    if includeSelf:
+        subs.add(class_)
+    return frozenset(subs)
+
+
 def getAllSubclasses(class_: type, includeSelf=False) -> set[type]:
     """
     Returns a set containing all child classes in the subclass graph of `class_`.
     I.e., includes subclasses of subclasses, etc.
+    Results are memoized per class; call `_invalidate_subclass_cache` (or subclass
+    `CachedSubclassMixin`) if classes are defined after the first query.
 
     # Parameters
     - `include_self`: Whether to include `class_` itself in the returned list
     - `class_`: Superclass
-
-    # Development
-    Since most class hierarchies are small, the inefficiencies of the existing recursive implementation aren't problematic.
-    It might be valuable to refactor with memoization if the need arises to use this function on a very large class hierarchy.
     """
-    subs: list[set[type]] = [
-        getAllSubclasses(sub, includeSelf=True)
-        for sub in class_.__subclasses__()
-        if sub is not None
-    ]
-    subs: set = set(flatten(subs))
-    if includeSelf:
-        subs.add(class_)
-    return subs
+    return set(_getAllSubclasses_cached(class_, includeSelf))
+
+
+@lru_cache(maxsize=256)
+def _leafClasses_cached(cls: type) -> frozenset[type]:
+    """Memoized recursion for `leafClasses`."""
+    return frozenset(
+        c for c in _getAllSubclasses_cached(cls, includeSelf=True)
+        if len(c.__subclasses__()) == 0
+    )
 
 
 def leafClasses(cls: type) -> list[type]:
@@ -148,13 +223,25 @@ def leafClasses(cls: type) -> list[type]:
     Leaf subclasses are those which have no subclasses of their own.
     :param cls:
     """
-    def leafClassesRecur(myclass):
-        if len(myclass.__subclasses__()) == 0:
-            return myclass
-        else:
-            return [leafClassesRecur(subclass) for subclass in myclass.__subclasses__()]
+    return list(_leafClasses_cached(cls))
 
-    return list(set(leaf for leaf in flatten(leafClassesRecur(cls))))
+
+def _invalidate_subclass_cache():
+    """Clears the memoized subclass-graph helpers. Call after defining new classes at runtime."""
+    _getAllSubclasses_cached.cache_clear()
+    _leafClasses_cached.cache_clear()
+
+
+class CachedSubclassMixin:
+    """
+    Opt-in mixin for class hierarchies queried via `getAllSubclasses`/`leafClasses`.
+    Invalidates the memoized subclass-graph helpers whenever a new subclass is defined,
+    so dynamically defined classes are never served stale results.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _invalidate_subclass_cache()
 
 
 def is_locally_defined(class_: type, binding: str) -> bool:
@@ -163,15 +250,21 @@ def is_locally_defined(class_: type, binding: str) -> bool:
     If the value assigned to `binding` is defined in `class_` but that values matches the value in a base class,
     it also returns True.
     """
-    return hasattr(class_, binding) and \
-        getattr(class_, binding) not in [getattr(b, binding, NotImplemented) for b in class_.__bases__]
+    # `__dict__` probe avoids triggering inherited descriptors, and the generator
+    # short-circuits on the first base holding the same value.
+    return binding in class_.__dict__ and \
+        class_.__dict__[binding] not in (getattr(b, binding, NotImplemented) for b in class_.__bases__)
+
+# Epoch shared by the timedelta/datetime converters below, built once at import.
+_EPOCH_1900 = datetime.datetime(1900, 1, 1, 0)
+
 
 def timedelta2datetime(td: datetime.timedelta) -> datetime.datetime:
-    return datetime.datetime(1900, 1, 1, 0)+td
+    return _EPOCH_1900 + td
 
 
 def datetime2timedelta(dt: datetime.datetime) -> datetime.timedelta:
-    return dt - datetime.datetime(1900, 1, 1, 0)
+    return dt - _EPOCH_1900
 
 
 def listEquals(list1: list, list2: list) -> bool:
@@ -183,24 +276,34 @@ def listEquals(list1: list, list2: list) -> bool:
     :param list2: Second list
     :return: True if the lists contain the same elements, regardless of order.
     """
-    if type(list1) != list:
+    if type(list1) is not list:
         return list1 == list2
-    elif type(list1) != type(list2) or len(list1) != len(list2):
+    if type(list2) is not list or len(list1) != len(list2):
         return False
-    elif type(list1) == list:
-        return all([listEquals(list1[i], list2[i]) for i in range(len(list1))])
-    elif len(list1)==0:
-        return True
+    return all(listEquals(a, b) for a, b in zip(list1, list2))
 
 
 def consolidateInterval(iv: portion.Interval, minIv) -> portion.Interval:
     """
     Consolidates AtomicIntervals in an Interval such that there is no gap less than minIv between any atomicIntervals.
-    Where such gaps are found, they are filled via portion.enclosure().
+    Where such gaps are found, they are filled by merging the neighboring atomicIntervals.
     :param minIv: Shortest allowable gap between any atomicIntervals.
     Must be comparable to the data type returned by T.__sub__(), where T is the type contained in iv.
     """
-    return functools.reduce(lambda x, y: x | y if y.lower-x.upper > minIv else x[:-1] | (x[-1] | y).enclosure, iv)
+    # Single left-to-right pass over the atomic data, building the result Interval once at the end,
+    # rather than functools.reduce rebuilding an Interval per step.
+    data = portion.to_data(iv)
+    if len(data) <= 1:
+        return iv
+    out = [list(data[0])]
+    for left, lower, upper, right in data[1:]:
+        cur = out[-1]
+        if lower - cur[2] > minIv:
+            out.append([left, lower, upper, right])
+        else:  # Merge into the current atomic, filling the gap
+            cur[2] = upper
+            cur[3] = right
+    return portion.from_data(out)
 
 
 def consolidateIntervalGaps(iv: portion.Interval, minIv) -> portion.Interval:
@@ -209,7 +312,13 @@ def consolidateIntervalGaps(iv: portion.Interval, minIv) -> portion.Interval:
     :param minIv: Shortest allowable AtomicInterval.
     Must be comparable to the data type returned by T.__sub__(), where T is the type contained in iv.
     """
-    return iv.apply(lambda x: x.replace(upper=x.upper-(x.upper-x.lower)) if x.upper-x.lower < minIv else x)
+    data = portion.to_data(iv)
+    if data and isinstance(data[0][1], (int, float, np.number)):
+        # Numeric endpoints: one vectorized subtract over all atomics instead of a Python lambda each.
+        arr = np.array([(lo, hi) for _, lo, hi, _ in data], dtype=float)
+        mask = (arr[:, 1] - arr[:, 0]) >= minIv
+        return portion.from_data([d for d, m in zip(data, mask) if m])
+    return portion.from_data([d for d in data if d[2] - d[1] >= minIv])
 
 
 def addLineBreaks(s: str, delim: str = ' ', maxLen: Optional[int] = None, delimIndices: Optional[list[int]] = None, insert: int = 0) -> str:
@@ -232,18 +341,16 @@ def addLineBreaks(s: str, delim: str = ' ', maxLen: Optional[int] = None, delimI
     if not ((maxLen is None) ^ (delimIndices is None)):
         raise ValueError('Either maxLen or delimIndices, but not both, must be specified.')
     if delimIndices is not None:
+        # Collect the segments and joiners into a list and join once, rather than
+        # re-concatenating the growing output string per delimiter.
         segments = s.split(delim)
         delimIndices = set(delimIndices)
-        out = segments[0]
-        for i, seg in enumerate(segments[:-1]):
-            # if i == 0:
-            #     continue
-            if i in delimIndices:
-                out = '\n'.join([out, segments[i+1]])
-            else:
-                out = delim.join([out, segments[i+1]])
+        pieces = [segments[0]]
+        for i, seg in enumerate(segments[1:]):
+            pieces.append('\n' if i in delimIndices else delim)
+            pieces.append(seg)
+        out = ''.join(pieces)
     return out
-        # return '\n'.join([delim.join([])])
 
 
 @runtime_checkable
@@ -252,15 +359,27 @@ class IsDataclass(Protocol):
     __dataclass_fields__: ClassVar[dict]
 
 
+@lru_cache(maxsize=512)
+def _compare_getter(tp: type) -> Callable[[IsDataclass], tuple]:
+    """
+    Returns a callable extracting the compare-enabled field values of a `tp` instance as a tuple.
+    Cached per dataclass so `get_hashable_eq_attrs` doesn't re-filter the fields per instance.
+    """
+    names = tuple(fld.name for fld in tp.__dataclass_fields__.values() if fld.compare)
+    if not names:
+        return lambda _: ()
+    if len(names) == 1:
+        getter = operator.attrgetter(names[0])
+        return lambda dc: (getter(dc),)
+    return operator.attrgetter(*names)
+
+
 def get_hashable_eq_attrs(dc: IsDataclass) -> tuple[Any]:
     """Returns a tuple of all fields used for equality comparison, including the type of the dataclass itself.
     The type is included to preserve the unequal equality behavior of instances of different dataclasses whose fields are identical.
     Essentially used to generate a hashable dataclass representation for equality comparison even if it's not frozen.
     """
-    return *(
-        getattr(dc, fld.name)
-        for fld in filter(lambda x: x.compare, dc.__dataclass_fields__.values())
-    ), type(dc)
+    return *_compare_getter(type(dc))(dc), type(dc)
 
 
 def dataclass_set_equals(
@@ -271,10 +390,15 @@ def dataclass_set_equals(
     Unfrozen dataclasses can't be placed in sets since they're not hashable.
     Collections of them may be compared using this function.
     """
-
-    return {get_hashable_eq_attrs(x) for x in coll1} == {
-        get_hashable_eq_attrs(y) for y in coll2
-    }
+    # Single pass over `coll2` instead of materializing a second set: bail out on the
+    # first element not in `s1`, then check that every element of `s1` was seen.
+    s1 = {get_hashable_eq_attrs(x) for x in coll1}
+    seen = set()
+    for t in (get_hashable_eq_attrs(y) for y in coll2):
+        if t not in s1:
+            return False
+        seen.add(t)
+    return len(seen) == len(s1)
 
 
 _T = TypeVar('_T')
@@ -295,53 +419,47 @@ def date_range_bins(ser: pd.Series, freq: str = 'W', normalize: bool = True, **k
     if 'bins' not in kwargs:
         a: pd.DatetimeIndex = pd.date_range(circ.head(1).values[0], circ.tail(1).values[0], freq=freq,
                                             normalize=normalize)
+        freqOffset = a.freq
 
         # `a` spans most of `ser`, but due to pandas' design both the head and tail of `ser` may lie outside.
         # `ser.head(1)` should only be at worst 1 `a.freq` less than `a[0]`, so extend head by 1.
-        headExtension = np.expand_dims(np.array(a[0] - a.freq), axis=(0,))
-
-        if a.freq.name in 'W D C B BH H T S L U N us ms min':  # frequency in weeks, days, or shorter
-            # `ser.tail(1)` may be many units of `a.freq` greater than `a[-1]` if `normalize`==True.
-            # Concatenate however many are needed to `a` to bound `ser.tail(1)`.
-            tailExtension = a[-1] + np.arange(((circ.iloc[-1] - a[-1]) // a.freq + 2)) * a.freq
+        headExtension = np.expand_dims(np.array(a[0] - freqOffset), axis=(0,))
+
+        # `ser.tail(1)` may be many units of `a.freq` greater than `a[-1]` if `normalize`==True.
+        # Extend `a` by however many periods are needed to bound `ser.tail(1)`.
+        if isinstance(freqOffset, pd.offsets.Tick):  # Fixed-duration frequency: days or shorter
+            nTail = int((circ.iloc[-1] - a[-1]) // pd.Timedelta(freqOffset)) + 2
+        elif freqOffset.name in {'W', 'D', 'C', 'B', 'BH', 'H', 'T', 'S', 'L', 'U', 'N', 'us', 'ms', 'min'}:
+            # Business-day-like offsets have no fixed duration; a calendar-day count over-covers safely.
+            nTail = int((circ.iloc[-1] - a[-1]) // pd.Timedelta(days=1)) + 2
         else:
-            tailExtension = np.expand_dims(np.array(a[-1] + a.freq), axis=(0,))
+            nTail = 1
+        tailExtension = pd.date_range(a[-1] + freqOffset, periods=nTail, freq=freqOffset).values
         # Expand the DateTimeIndex by on either end. Ensures that `ser.head` and `ser.tail` are both contained inside.
-        a = a.union(np.concatenate([headExtension, tailExtension]))
+        a = a.union(pd.DatetimeIndex(np.concatenate([headExtension, tailExtension])))
         kwargs['bins'] = a
     return pd.cut(circ, right=False, **kwargs)
 
 
-def backtrack(sol, cur):
+def backtrack(nums) -> Generator:
     """
-
-    :param sol:
-    :param cur:
-    :return:
+    Generates all permutations of `nums` iteratively with an explicit stack of partial solutions,
+    avoiding one Python frame per branch of the recursion tree.
+    :param nums: Collection of unique elements to permute.
+    :return: Generator over the permutations of `nums`, each as a list.
     """
     # TODO: generalize this to be callable like a library function.
     # Prob pass in procedures for isSolution, constructCandidates, processSolution
-    # Figure out how to handle processSolution appending to an outside list.
-
-    def isSolution(a, k):
-        # nonlocal n
-        return k == n
-
-    def constructCandidates(a, k):
-        return [a[:k] + [i] + a[k + 1:] for i in nums if i not in a]
-
-    def processSolution(a):
-        # nonlocal out
-        out.append(a)
-
-    if isSolution(sol, cur):
-        processSolution(sol)
-    else:
-        nextSols = constructCandidates(sol, cur)
-        cur += 1
-        for nextSol in nextSols:
-            # print(f'nextSol: {nextSol}')
-            backtrack(nextSol, cur)
+    n = len(nums)
+    stack: list[list] = [[]]
+    while stack:
+        a = stack.pop()
+        if len(a) == n:
+            yield a
+            continue
+        for i in nums:
+            if i not in a:
+                stack.append(a + [i])
 
 
 class LinkedHeapNode:
@@ -452,8 +570,9 @@ class LinkedMinHeap:
             return out
         out = self.head
         firstIter = True
+        cmp = self.compF
         while out.right:  # Impossible for a node to have a right child but no left child
-            if self.compF(out.left) > self.compF(out.right):
+            if cmp(out.left) > cmp(out.right):
                 self._swapWithParent(out.right)
             else:
                 self._swapWithParent(out.left)
@@ -545,20 +664,20 @@ class LinkedMinHeap:
                 return parent
             else:
                 h = self._getHeight(treeSize)
-                nOnAboveLevels = round(math.pow(2, h - 1)) - 1
-                nOnInsertionRow = (treeSize - nOnAboveLevels) % round(math.pow(2, h - 1))
-                if nOnInsertionRow == 0:  # or nOnInsertionRow == round(math.pow(2, h-1)):
+                nOnAboveLevels = (1 << (h - 1)) - 1
+                nOnInsertionRow = (treeSize - nOnAboveLevels) % (1 << (h - 1))
+                if nOnInsertionRow == 0:  # or nOnInsertionRow == 1 << (h-1):
                     child = parent.left
                     while child.left:
                         child = child.left
                     return child
                 # Could optimize here and add a shortcut if nOnInsertionRow==0 or ==2^(h-1), go all the way down left/right
-                if nOnInsertionRow >= round(math.pow(2, h - 2)):
+                if nOnInsertionRow >= 1 << (h - 2):
                     # print(f'BranchR')
-                    return _getChild(parent.right, treeSize - round(math.pow(2, h - 1)))
+                    return _getChild(parent.right, treeSize - (1 << (h - 1)))
                 else:
                     # print(f'BranchL')
-                    return _getChild(parent.left, treeSize - round(math.pow(2, h - 2)))
+                    return _getChild(parent.left, treeSize - (1 << (h - 2)))
 
         if not size: size = self.size
         return _getChild(self.head, size)
@@ -569,19 +688,17 @@ class LinkedMinHeap:
     @staticmethod
     def _getHeight(treeSize):
         # if not self.head: return 0
-        h = 1
-        a = treeSize
-        while a > 1:
-            h += 1
-            a = int(a / 2)
-        return h
+        # bit_length is the single-instruction equivalent of the old halving loop.
+        return treeSize.bit_length() if treeSize else 1
 
     def _bubbleUp(self, item):
         # if not item.left:
         #     leaf = True
         # else:
         #     leaf = False
-        while item.parent and self.compF(item) < self.compF(item.parent):
+        cmp = self.compF
+        itemKey = cmp(item)  # `item`'s key is invariant across swaps; only its neighbors change
+        while item.parent and itemKey < cmp(item.parent):
             if item == self.last:
                 self.last = item.parent
             self._swapWithParent(item)
@@ -589,18 +706,23 @@ class LinkedMinHeap:
     def _bubbleDown(self, node):
         # print(f'enter bubdown\n{self.__str__(node)}')
         firstIter = True
+        cmp = self.compF
+        nodeKey = cmp(node)  # `node`'s key is invariant across swaps; only its neighbors change
         while node.right:  # Impossible for a node to have a right child but no left child
-            if (self.compF(node.left) > self.compF(node.right)) and (self.compF(node) > self.compF(node.right)):
-                self._swapWithParent(node.right)
-            elif (self.compF(node.left) < self.compF(node.right)) and (self.compF(node) > self.compF(node.left)):
-                self._swapWithParent(node.left)
+            left, right = node.left, node.right
+            leftKey, rightKey = cmp(left), cmp(right)
+            if leftKey > rightKey and nodeKey > rightKey:
+                self._swapWithParent(right)
+            elif leftKey < rightKey and nodeKey > leftKey:
+                self._swapWithParent(left)
             else:
                 break
             if firstIter:
                 self.head = node.parent
                 firstIter = False
-        if node.left and self.compF(node.left) < self.compF(node):
-            self._swapWithParent(node.left)
+        left = node.left
+        if left and cmp(left) < nodeKey:
+            self._swapWithParent(left)
         # print(f'exit bubdown\n{self.__str__(self.head)}')
         # if node.parent == self.last:
         #     self.last = node
@@ -614,6 +736,64 @@ class LinkedMinHeap:
         ret += self.__str__(node.right, level + 1)
         return ret
 
+class ArrayMinHeap:
+    """
+    A list-backed min-heap using the stdlib `heapq` sift routines.
+    Preferred over `LinkedMinHeap` for new code: the contiguous array layout replaces
+    per-node pointer chasing, and each push/pop is a single C-level sift.
+    When a `key` is given, entries are stored as `(key(item), tiebreak, item)` tuples,
+    so `key` results only need to support `<` and ties are broken by insertion order.
+    When `key` is None, items are stored raw and must be mutually comparable; numeric
+    workloads (int/float keys) then run entirely inside the C sift loops with no
+    per-item tuple wrapping.
+
+    :param items: Initial heap contents.
+    :param key: Callable mapping an item to its comparison key. Defaults to the item itself.
+    """
+
+    def __init__(self, items: Iterable = (), key: Optional[Callable[[Any], Any]] = None):
+        self.key = key
+        if key is None:
+            self._data: list = list(items)
+        else:
+            self._counter = itertools.count()
+            self._data = [(key(x), next(self._counter), x) for x in items]
+        heapq.heapify(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __bool__(self):
+        return bool(self._data)
+
+    def peek(self):
+        """Returns the minimum item without removing it."""
+        entry = self._data[0]
+        return entry if self.key is None else entry[2]
+
+    def push(self, item):
+        if self.key is None:
+            heapq.heappush(self._data, item)
+        else:
+            heapq.heappush(self._data, (self.key(item), next(self._counter), item))
+
+    def pop(self):
+        if not self._data:
+            raise IndexError('Empty heap cannot be popped')
+        out = heapq.heappop(self._data)
+        return out if self.key is None else out[2]
+
+    def popPush(self, item):
+        """A pop and push in a single operation. Needs only a single sift instead of two."""
+        if not self._data:
+            raise IndexError('Empty heap cannot be popped')
+        if self.key is None:
+            return heapq.heapreplace(self._data, item)
+        return heapq.heapreplace(
+            self._data, (self.key(item), next(self._counter), item)
+        )[2]
+
+
 """Yaml Codecs"""
 # 2-way mappings between the types and the yaml tags
 
@@ -630,6 +810,8 @@ class YamlCodecDatetimes(YamlCodec):
                           np.timedelta64: ('np.timedelta64', ('days', 'seconds', 'microseconds')),
                           }
     yaml_tags_to_types = dict(zip([val[0] for val in types_to_yaml_tags.values()], types_to_yaml_tags.keys()))
+    # Per-type attrgetters, built once so encoding does a single C-level fetch per object
+    _getters = {tp: operator.attrgetter(*spec[1]) for tp, spec in types_to_yaml_tags.items() if spec[1]}
 
     @classmethod
     def get_yaml_prefix(cls):
@@ -643,7 +825,7 @@ class YamlCodecDatetimes(YamlCodec):
     @classmethod
     def is_yaml_tag_supported(cls, yaml_tag: str) -> bool:
         # return True if the given yaml tag suffix is supported
-        return yaml_tag in cls.yaml_tags_to_types.keys()
+        return yaml_tag in cls.yaml_tags_to_types
 
     @classmethod
     def from_yaml_dict(cls, yaml_tag_suffix: str, dct, **kwargs):
@@ -654,9 +836,14 @@ class YamlCodecDatetimes(YamlCodec):
     @classmethod
     def to_yaml_dict(cls, obj) -> tuple[str, Any]:
         # Encode the given object and also return the tag that it should have
-        return cls.types_to_yaml_tags[type(obj)][0],\
-            {key: obj.__getattribute__(key) for key in cls.types_to_yaml_tags[type(obj)][1]
-             if obj.__getattribute__(key) not in (None, 0)}
+        tag, names = cls.types_to_yaml_tags[type(obj)]
+        getter = cls._getters.get(type(obj))
+        if getter is None:  # Types with no encodable attributes, e.g. pd.NaT
+            return tag, {}
+        vals = getter(obj)
+        if len(names) == 1:  # attrgetter returns a scalar for a single name
+            vals = (vals,)
+        return tag, {key: val for key, val in zip(names, vals) if val not in (None, 0)}
 
     @classmethod
     def from_yaml_scalar(cls, yaml_tag_suffix, scalar, **kwargs):
@@ -686,7 +873,7 @@ class YamlCodecMisc(YamlCodec):
     @classmethod
     def is_yaml_tag_supported(cls, yaml_tag: str) -> bool:
         # return True if the given yaml tag suffix is supported
-        return yaml_tag in cls.yaml_tags_to_types.keys()
+        return yaml_tag in cls.yaml_tags_to_types
 
     @classmethod
     def from_yaml_dict(cls, yaml_tag_suffix: str, dct, **kwargs):
@@ -1,18 +1,66 @@
 from functools import lru_cache
 from typing import Callable
 import abc
-import copy
 
-from kiwiutils.kiwilib import getAllSubclasses
+import aenum
+
+from kiwiutils.kiwilib import getAllSubclasses, _invalidate_subclass_cache
 from kiwiutils.enums import HierarchicalEnum, DataclassValuedEnum, AenumABCMeta
 
 
+# Locale maps interned by their (locale, callable) items: subclasses inheriting the
+# same aliasFuncs implementation share one dict instead of storing a copy apiece.
+# Assumes the callables are stable module-level objects, as aliasFuncs implementations are.
+_interned_alias_maps: dict[tuple, dict] = {}
+
+
+# One canonical instance per hierarchy node class. Nodes are stateless, so
+# aliases_to_members can reuse an instance instead of re-running constructors
+# on every rebuild.
+_instance_cache: dict[type, 'AliasableHierEnum'] = {}
+
+
+def _inst(sub: type) -> 'AliasableHierEnum':
+    out = _instance_cache.get(sub)
+    if out is None:
+        _instance_cache[sub] = out = sub()
+    return out
+
+
+def _default_alias(x: 'Aliasable') -> str:
+    """
+    Default `alias_func` for the `aliases_to_members*` classmethods.
+    A stable module-level function, so caches keyed on the callable hit across calls;
+    user-supplied per-call lambdas miss those caches — prefer module-level functions
+    or `functools.partial`.
+    """
+    return x.alias()
+
+
 class Aliasable(abc.ABC):
+    # Aliasable itself holds no instance state; empty slots keep the mixin from
+    # forcing a __dict__ onto subclasses that define their own slots.
+    __slots__ = ()
+
     def alias(self, locale: str = None):
-        if locale is None:
-            # locale = self.aliasFuncs()[self.defaultLocale]
-            locale = self._defaultLocale
-        return self._aliasFuncs[locale](self)
+        # locale = self.aliasFuncs()[self.defaultLocale]
+        loc = locale if locale is not None else self._defaultLocale
+        # Aliasable instances are effectively singletons (enum members, hierarchy nodes),
+        # so the alias per (instance, locale) never changes; memoize it on the instance.
+        memo = getattr(self, '_alias_memo', None)
+        if memo is None:
+            memo = {}
+            object.__setattr__(self, '_alias_memo', memo)
+        out = memo.get(loc)
+        if out is None:
+            # Default-locale path is a single attribute load; explicit locales fall
+            # back to the dict of alias callables.
+            if locale is None:
+                out = self._default_alias_fn(self)
+            else:
+                out = self._alias_fns[self._locale_index[loc]](self)
+            memo[loc] = out
+        return out
 
     @classmethod
     @abc.abstractmethod
@@ -31,16 +79,56 @@ class Aliasable(abc.ABC):
 
     @classmethod
     def setDefaultLocale(cls, locale: str):
+        # Validate up front so a bad locale fails here, not deep inside a later alias() call.
+        idx = cls._locale_index.get(locale)
+        if idx is None:
+            raise KeyError(f'{locale!r} is not a locale of {cls}; expected one of {cls._locales}')
         cls._defaultLocale = locale
+        cls._default_idx = idx
+        cls._default_alias_fn = staticmethod(cls._alias_fns[idx])
 
     @staticmethod
     def initAliasable(cls_: type):
-        cls_._aliasFuncs = cls_.aliasFuncs()
-        cls_._defaultLocale = next(iter(cls_._aliasFuncs.keys()))
+        afs = cls_.aliasFuncs()
+        # Keyed on the ordered items so the first-locale default is preserved.
+        afs = _interned_alias_maps.setdefault(tuple(afs.items()), afs)
+        cls_._aliasFuncs = afs  # kept for back-compat with direct users
+        # Parallel structure-of-arrays layout: locale tuple, callable tuple, and an
+        # index map, so hot paths index tuples instead of hashing into the dict.
+        cls_._locales = locales = tuple(afs)
+        cls_._alias_fns = tuple(afs.values())
+        cls_._locale_index = {loc: i for i, loc in enumerate(locales)}
+        cls_._defaultLocale = default = locales[0]
+        cls_._default_idx = 0
+        # One class attribute per locale for attribute-style dispatch. staticmethod
+        # wrapping keeps instance access from binding the callable and passing self twice.
+        for loc, fn in afs.items():
+            setattr(cls_, '_alias_' + loc.replace('-', '_'), staticmethod(fn))
+        cls_._default_alias_fn = staticmethod(afs[default])
+        if isinstance(cls_, aenum.EnumMeta):
+            # Enum members are finite and already exist here, so their alias memos can
+            # be filled eagerly: alias() then never dispatches a locale callable at all.
+            for member in cls_:
+                object.__setattr__(
+                    member, '_alias_memo', {loc: fn(member) for loc, fn in afs.items()}
+                )
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
-        if "__isabstractmethod__" not in cls.aliasFuncs.__dict__ or not cls.aliasFuncs.__isabstractmethod__:
+        # The subclass graph grew, so the memoized getAllSubclasses results feeding
+        # aliases_to_members* are stale. HierarchicalEnum invalidates on its own, but
+        # Aliasable trees built on plain Enums need it done here.
+        _invalidate_subclass_cache()
+        a2m = getattr(cls, 'aliases_to_members', None)
+        if a2m is not None and hasattr(a2m, 'cache_clear'):
+            a2m.cache_clear()
+        # Every ancestor's deep-alias mapping now omits this subclass's members;
+        # each class holds its own cache, so walk the MRO and drop them all.
+        for ancestor in cls.__mro__:
+            deep_cache = ancestor.__dict__.get('_deep_alias_cache')
+            if deep_cache:
+                deep_cache.clear()
+        if not getattr(cls.aliasFuncs, "__isabstractmethod__", False):
             # Only for subclasses which have implemented `aliasFuncs`
             cls.initAliasable(cls)
         # if not any([hasattr(base, '_subclasses') and cls._subclasses == base._subclasses for base in cls.__bases__]):
@@ -56,18 +144,40 @@ class Aliasable(abc.ABC):
 
 class AliasableEnum(Aliasable, DataclassValuedEnum, metaclass=AenumABCMeta):
     @classmethod
-    @lru_cache
     def aliases_to_members_deep(
             cls,
-            alias_func: Callable[['AliasableEnum', str], str] = lambda x, loc: x.alias(loc)
+            alias_func: Callable[['AliasableEnum'], str] = _default_alias
     ) -> dict[str, 'AliasableEnum']:
         """
         Returns a mapping from aliases to enum members for the members of all subclasses of `cls`.
-        Warning: In the case of duplicate keys among multiple subclasses,
-        the function behavior is undefined for which enum member is returned in the value.
+        Results are cached per (class, alias_func); pass a module-level function or `functools.partial`
+        rather than a fresh lambda per call to benefit from the cache.
+        :raises ValueError: If the same alias is produced by multiple members among the subclasses.
         """
-            # return {sub: {a.alias(locale): a for a in sub} for sub in getAllSubclasses(cls, includeSelf=True)}
-        return {alias_func(a): a for sub in getAllSubclasses(cls, includeSelf=True) for a in sub}
+        # Explicit dict cache on each class rather than lru_cache: keyed by the alias_func
+        # object and stored via `cls.__dict__` so subclasses don't share an inherited cache.
+        cache = cls.__dict__.get('_deep_alias_cache')
+        if cache is None:
+            cache = {}
+            cls._deep_alias_cache = cache
+        out = cache.get(alias_func)
+        if out is None:
+            # Build and duplicate-check in the same pass: setdefault is one hash per
+            # member, and returns the prior occupant when an alias collides.
+            subs = getAllSubclasses(cls, includeSelf=True)
+            out = {}
+            dups = []
+            af = alias_func  # loop-local bindings keep the hot loop to LOAD_FASTs
+            out_setdefault = out.setdefault
+            for sub in subs:
+                for a in sub:
+                    k = af(a)
+                    if out_setdefault(k, a) is not a:
+                        dups.append(k)
+            if dups:
+                raise ValueError(f'The subclasses of {cls} contain duplicate localizations: {dups}')
+            cache[alias_func] = out
+        return out
 
 
 class AliasableHierEnum(Aliasable, HierarchicalEnum):
@@ -79,21 +189,23 @@ class AliasableHierEnum(Aliasable, HierarchicalEnum):
         In the case of multiple inheritance, this will return the first superclass in the MRO which is a direct
         subclass of HierarchicalEnum.
         """
-        if cls._ROOT_CLASS is not None:
-            return cls._ROOT_CLASS
-        elif cls == AliasableHierEnum:
-            return cls
-        elif AliasableHierEnum in cls.__bases__:
-            cls._ROOT_CLASS = cls
-            return cls
-        else:
-            return cls.__bases__[0].root_class()
+        # `cls.__dict__` rather than attribute access, so a subclass never serves an
+        # inherited ancestor's cached root. Every branch writes the cache back, making
+        # the recursive base walk a one-time cost per class.
+        rc = cls.__dict__.get('_ROOT_CLASS')
+        if rc is None:
+            if cls is AliasableHierEnum or AliasableHierEnum in cls.__bases__:
+                rc = cls
+            else:
+                rc = cls.__bases__[0].root_class()
+            cls._ROOT_CLASS = rc
+        return rc
 
     @classmethod
-    @lru_cache
+    @lru_cache(maxsize=32)
     def aliases_to_members(
             cls,
-            alias_func: Callable[['AliasableHierEnum', str], str] = lambda x, loc: x.alias(loc)
+            alias_func: Callable[['AliasableHierEnum'], str] = _default_alias
     ) -> dict[str, 'AliasableHierEnum']:
         """
         Returns a mapping from aliases to enum members for the members of all subclasses of `cls`.
@@ -101,12 +213,14 @@ class AliasableHierEnum(Aliasable, HierarchicalEnum):
         the function behavior is undefined for which enum member is returned in the value.
         :param alias_func: Alias function. Defaults to standard alias, but others might be wanted, like `builtins._e`.
         """
-        out = {alias_func(sub()): sub for sub in getAllSubclasses(cls)}
-        if len(out) < len(getAllSubclasses(cls)):
-            subs: dict[type, str] = {c: c().alias(locale) for c in getAllSubclasses(cls)}
-            for sub, alias in copy.copy(subs).items():
-                if alias in out:
-                    subs.pop(sub)
-                    out.pop(alias)
-            raise ValueError(f'The subclass DAG of {cls} contains duplicate localizations: {subs.keys()}')
+        # One pass collecting (alias, subclass) pairs: no re-instantiation of every
+        # subclass in the duplicate branch, which also referenced an undefined locale.
+        af = alias_func
+        pairs = [(af(_inst(sub)), sub) for sub in getAllSubclasses(cls)]
+        out = dict(pairs)
+        if len(out) < len(pairs):
+            # Single pass: a subclass is reported when its alias was already seen.
+            seen = set()
+            dups = [sub for alias, sub in pairs if alias in seen or seen.add(alias)]
+            raise ValueError(f'The subclass DAG of {cls} contains duplicate localizations: {dups}')
         return out
\ No newline at end of file